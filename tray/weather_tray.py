@@ -6,12 +6,38 @@ import os
 import sys
 import json
 import time
+import urllib.error
 import urllib.request
 import urllib.parse
 from datetime import datetime
 import threading
 import tempfile
 import hashlib
+import functools
+import gzip
+import io
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # json.loads accepts UTF-8 bytes directly, so both paths take raw bytes
+    _json_loads = json.loads
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 try:
     import gi
@@ -22,14 +48,24 @@ try:
     except (ValueError, ImportError):
         gi.require_version('AppIndicator3', '0.1')
         from gi.repository import AppIndicator3
-    from gi.repository import Gtk, GLib, Gdk, Pango, PangoCairo
-    import cairo
+    from gi.repository import Gtk, GLib, Gdk
 except Exception as e:
     sys.stderr.write("PyGObject (Gtk/AppIndicator) is required: apt install python3-gi gir1.2-gtk-3.0 gir1.2-ayatanaappindicator3-0.1\n")
     raise
 
 APP_ID = 'weather-check-tray'
 REFRESH_SECONDS = int(os.getenv('WEATHER_TRAY_REFRESH', '600'))
+# Reuse a cached forecast younger than this (quick restarts, manual refreshes)
+CACHE_TTL_SECONDS = REFRESH_SECONDS // 2
+# Use same UA as CLI to avoid server-side content differences
+USER_AGENT = 'weather-check'
+# Tray icon size in px
+ICON_SIZE = int(os.getenv('WEATHER_TRAY_ICON_SIZE', '24'))
+# Bump when the overlay drawing changes so stale PNGs in the cache dir are not reused
+ICON_RENDER_VERSION = 2
+# Rendered overlay icons kept on disk, and how many new icons between prunes
+ICON_CACHE_MAX_FILES = 64
+ICON_CACHE_EVICT_EVERY = 16
 CITY = None
 
 # Basic mapping from MET Norway symbol codes to common theme icon names
@@ -43,17 +79,70 @@ SYMBOL_ICON_MAP = [
 ]
 DEFAULT_ICON = 'weather-severe-alert-symbolic'
 
+# Canonical MET Norway symbol codes, without the _day/_night/_polartwilight
+# suffix (the "lights" typos are MET's own spelling)
+MET_SYMBOL_CODES = (
+    'clearsky', 'fair', 'partlycloudy', 'cloudy', 'fog',
+    'lightrain', 'rain', 'heavyrain',
+    'lightrainshowers', 'rainshowers', 'heavyrainshowers',
+    'lightrainandthunder', 'rainandthunder', 'heavyrainandthunder',
+    'lightrainshowersandthunder', 'rainshowersandthunder', 'heavyrainshowersandthunder',
+    'lightsleet', 'sleet', 'heavysleet',
+    'lightsleetshowers', 'sleetshowers', 'heavysleetshowers',
+    'lightsleetandthunder', 'sleetandthunder', 'heavysleetandthunder',
+    'lightssleetshowersandthunder', 'sleetshowersandthunder', 'heavysleetshowersandthunder',
+    'lightsnow', 'snow', 'heavysnow',
+    'lightsnowshowers', 'snowshowers', 'heavysnowshowers',
+    'lightsnowandthunder', 'snowandthunder', 'heavysnowandthunder',
+    'lightssnowshowersandthunder', 'snowshowersandthunder', 'heavysnowshowersandthunder',
+)
+
+
+# Shared keep-alive session so refreshes reuse TCP/TLS connections
+if requests is not None:
+    _session = requests.Session()
+    _session.headers['User-Agent'] = USER_AGENT
+else:
+    _session = None
+
+
+def http_get(url, headers=None, timeout=10):
+    """Fetch url and return (status, headers, body bytes).
+    A 304 Not Modified is returned as a normal result with an empty body.
+    """
+    # requests negotiates gzip/deflate and decodes r.content transparently
+    if _session is not None:
+        r = _session.get(url, headers=headers, timeout=timeout)
+        if r.status_code == 304:
+            return r.status_code, r.headers, b''
+        r.raise_for_status()
+        return r.status_code, r.headers, r.content
+
+    hdrs = {'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip'}
+    if headers:
+        hdrs.update(headers)
+    req = urllib.request.Request(url, headers=hdrs)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            data = resp.read()
+            if resp.headers.get('Content-Encoding') == 'gzip':
+                data = gzip.decompress(data)
+            return resp.status, resp.headers, data
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return e.code, e.headers, b''
+        raise
+
 
 def http_get_json(url, timeout=10):
-    # Use same UA as CLI to avoid server-side content differences
-    req = urllib.request.Request(url, headers={'User-Agent': 'weather-check'})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode('utf-8'))
+    _, _, data = http_get(url, timeout=timeout)
+    return _json_loads(data)
 
 
 def detect_city():
     try:
-        city = urllib.request.urlopen('https://ipinfo.io/city', timeout=5).read().decode('utf-8').strip()
+        _, _, data = http_get('https://ipinfo.io/city', timeout=5)
+        city = data.decode('utf-8').strip()
         return city or 'Sofia'
     except Exception:
         return 'Sofia'
@@ -71,21 +160,183 @@ def get_coords(city):
     return 42.6977, 23.3219  # Sofia fallback
 
 
-def fetch_weather(lat, lon):
+class _Record(dict):
+    """Stand-in for msgspec.Struct: attribute access, None for missing keys."""
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        return self.get(name)
+
+
+# Schema for the parts of the MET locationforecast response we read. Decoding
+# straight into Structs validates the shape and gives attribute access.
+if msgspec is not None:
+    class Details(msgspec.Struct):
+        air_temperature: float | None = None
+        wind_speed: float | None = None
+        relative_humidity: float | None = None
+        air_pressure_at_sea_level: float | None = None
+        precipitation_amount: float | None = None
+
+    class Summary(msgspec.Struct):
+        symbol_code: str | None = None
+
+    class Period(msgspec.Struct):
+        summary: Summary | None = None
+        details: Details | None = None
+
+    class Instant(msgspec.Struct):
+        details: Details
+
+    class StepData(msgspec.Struct):
+        instant: Instant
+        next_1_hours: Period | None = None
+        next_6_hours: Period | None = None
+        next_12_hours: Period | None = None
+
+    class TimeStep(msgspec.Struct):
+        time: str
+        data: StepData
+
+    class Properties(msgspec.Struct):
+        timeseries: list[TimeStep]
+
+    class Forecast(msgspec.Struct):
+        properties: Properties
+
+    decode_forecast = msgspec.json.Decoder(Forecast).decode
+else:
+    def decode_forecast(raw):
+        return json.loads(raw, object_hook=_Record)
+
+
+def first_timestep(raw):
+    """Return only the first timeseries entry of a raw MET forecast, streamed
+    with ijson. A small buffer lets it stop well before the rest of the
+    document is tokenized; with msgspec the entry is validated as a TimeStep.
+    """
+    items = ijson.items(io.BytesIO(raw), 'properties.timeseries.item', buf_size=1024,
+                        use_float=True, map_type=dict if msgspec is not None else _Record)
+    for entry in items:
+        if msgspec is not None:
+            return msgspec.convert(entry, TimeStep)
+        return entry
+    raise ValueError('forecast has no timeseries entries')
+
+
+def step_symbol_code(step):
+    # Match CLI fallback: next_1_hours -> next_6_hours -> next_12_hours
+    d = step.data
+    for period in (d.next_1_hours, d.next_6_hours, d.next_12_hours):
+        if period and period.summary and period.summary.symbol_code:
+            return period.summary.symbol_code
+    return ''
+
+
+def _cache_path(lat, lon):
+    return os.path.join(tempfile.gettempdir(), f'weather-check-cache-{lat:.4f}_{lon:.4f}.json')
+
+
+def _write_atomic(path, data):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def fetch_forecast(lat, lon):
+    """Return (raw JSON, decoded forecast or None) for (lat, lon). The raw body
+    is served from an on-disk cache while it is younger than CACHE_TTL_SECONDS;
+    stale entries are revalidated with If-Modified-Since, as MET Norway's terms
+    of service ask. Fresh downloads are decoded (validated) before caching, and
+    that decoded forecast is returned so callers need not parse it again.
+    """
+    path = _cache_path(lat, lon)
+    lm_path = path + '.lm'
+    try:
+        # A future mtime (clock skew, foreign file) does not count as fresh
+        if 0 <= time.time() - os.stat(path).st_mtime < CACHE_TTL_SECONDS:
+            with open(path, 'rb') as f:
+                return f.read(), None
+    except OSError:
+        pass
+
+    headers = {}
+    try:
+        with open(lm_path, 'r', encoding='utf-8') as f:
+            last_modified = f.read().strip()
+        if last_modified and os.path.exists(path):
+            headers['If-Modified-Since'] = last_modified
+    except OSError:
+        pass
+
     url = f"https://api.met.no/weatherapi/locationforecast/2.0/compact?lat={lat}&lon={lon}"
-    return http_get_json(url)
+    status, resp_headers, data = http_get(url, headers=headers)
+    if status == 304:
+        # Still current: bump mtime so the TTL starts over
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # e.g. cache file owned by another user
+        try:
+            with open(path, 'rb') as f:
+                return f.read(), None
+        except OSError:
+            # Cached body vanished or is unreadable: fetch it unconditionally
+            status, resp_headers, data = http_get(url)
 
+    # Never cache a body that is not a usable forecast
+    forecast = decode_forecast(data)
+    if not forecast.properties.timeseries:
+        raise ValueError('forecast has no timeseries entries')
 
-def icon_name_from_symbol(symbol_code):
-    if not symbol_code:
-        return DEFAULT_ICON
-    s = symbol_code.lower()
+    try:
+        _write_atomic(path, data)
+        last_modified = resp_headers.get('Last-Modified')
+        if last_modified:
+            _write_atomic(lm_path, last_modified.encode('utf-8'))
+    except OSError:
+        pass  # Cache is best-effort
+    return data, forecast
+
+
+def _match_symbol(s):
     for keys, icon in SYMBOL_ICON_MAP:
         if any(k in s for k in keys):
             return icon
     return DEFAULT_ICON
 
 
+# Precomputed symbol code -> icon name lookup
+_SYMBOL_LUT = {code: _match_symbol(code) for code in MET_SYMBOL_CODES}
+
+
+@functools.lru_cache(maxsize=64)
+def icon_name_from_symbol(symbol_code):
+    if not symbol_code:
+        return DEFAULT_ICON
+    head = symbol_code.lower().partition('_')[0]
+    icon = _SYMBOL_LUT.get(head)
+    if icon is None:
+        # Unknown/new code: fall back to substring matching
+        icon = _match_symbol(head)
+    return icon
+
+
+_render_modules = {}
+
+
+def _lazy_imports():
+    """Import the cairo/Pango rendering stack on first use so the indicator
+    appears without waiting for it. Returns a dict of the loaded modules.
+    """
+    if not _render_modules:
+        import cairo
+        from gi.repository import Pango, PangoCairo
+        _render_modules.update(cairo=cairo, Pango=Pango, PangoCairo=PangoCairo)
+    return _render_modules
+
+
 def safe_temp(v):
     try:
         return float(v)
@@ -95,7 +346,9 @@ def safe_temp(v):
 
 class WeatherTray:
     def __init__(self, city=None):
-        self.city = city or detect_city()
+        # City detection and geocoding run in the first refresh worker so the
+        # indicator shows up without waiting on the network
+        self.city = city
         self.ind = AppIndicator3.Indicator.new(
             APP_ID, DEFAULT_ICON, AppIndicator3.IndicatorCategory.APPLICATION_STATUS
         )
@@ -106,7 +359,7 @@ class WeatherTray:
 
         # Menu
         self.menu = Gtk.Menu()
-        self.item_title = Gtk.MenuItem(label=f"Weather — {self.city}")
+        self.item_title = Gtk.MenuItem(label=f"Weather — {self.city or '…'}")
         self.item_title.set_sensitive(False)
         self.menu.append(self.item_title)
 
@@ -129,85 +382,154 @@ class WeatherTray:
         self.ind.set_menu(self.menu)
 
         # Data/init
-        self._lat, self._lon = get_coords(self.city)
+        self._lat = self._lon = None
         self._last_update = None
+        self._last_raw = None
         self._last_data = None
+        self._refresh_in_flight = False
         # Icon cache dir for dynamic icons with text overlay (use theme-like layout)
         self._icon_cache_dir = os.path.join(tempfile.gettempdir(), 'weather-check-icons')
         # Create hicolor theme subdir so AppIndicator can find icons by name
-        self._icon_theme_status_24 = os.path.join(self._icon_cache_dir, 'hicolor', '24x24', 'status')
-        os.makedirs(self._icon_theme_status_24, exist_ok=True)
+        self._icon_status_dir = os.path.join(
+            self._icon_cache_dir, 'hicolor', f'{ICON_SIZE}x{ICON_SIZE}', 'status'
+        )
+        os.makedirs(self._icon_status_dir, exist_ok=True)
         self.ind.set_icon_theme_path(self._icon_cache_dir)
         self._last_icon_file = None
-        GLib.idle_add(self.refresh_async)
+        self._last_icon_key = None
+        self._icons_written = 0
+        # Base theme icons as cairo surfaces, keyed by (icon name, size)
+        self._base_icon_cache = {}
+        # Pango layout/font for the overlay text, built on first render
+        self._text_layout = None
+        self._font_desc = None
+        Gtk.IconTheme.get_default().connect('changed', self._on_icon_theme_changed)
+        GLib.idle_add(self._initial_refresh)
         GLib.timeout_add_seconds(REFRESH_SECONDS, self.refresh_async)
 
-    def _render_icon_with_text(self, base_icon_name: str, text: str, size: int = 24) -> str:
+    def _render_icon_with_text(self, base_icon_name: str, text: str) -> str:
         """Render an icon by overlaying text onto the base weather icon.
-        Returns the icon name (without extension) placed in the icon cache dir.
+        Returns the path of the PNG placed in the icon cache dir.
         """
         try:
+            # Icons are content-addressed: same drawing code, icon theme, base
+            # icon and text -> same file (the directory already encodes the size)
+            theme_name = Gtk.Settings.get_default().props.gtk_icon_theme_name
+            key = f"{ICON_RENDER_VERSION}|{theme_name}|{base_icon_name}|{text}"
+            h = hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
+            icon_path = os.path.join(self._icon_status_dir, f"weather_temp_{h}.png")
+            if os.path.exists(icon_path):
+                os.utime(icon_path)  # Mark as recently used for eviction
+                self._last_icon_file = icon_path
+                return icon_path
+
+            self._draw_icon(base_icon_name, text, ICON_SIZE).write_to_png(icon_path)
+            self._last_icon_file = icon_path
+            self._icons_written += 1
+            # Prune on the first new icon of each run too, so short sessions
+            # (restarted every login) still bound the shared cache dir
+            if self._icons_written % ICON_CACHE_EVICT_EVERY == 1:
+                self._evict_old_icons()
+            return icon_path
+        except Exception:
+            return base_icon_name  # Fallback to base icon name
+
+    def _draw_icon(self, base_icon_name: str, text: str, size: int):
+        mods = _lazy_imports()
+        cairo, Pango, PangoCairo = mods['cairo'], mods['Pango'], mods['PangoCairo']
+        # Create cairo surface
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, size, size)
+        cr = cairo.Context(surface)
+
+        # Paint base icon at its native size
+        cr.set_source_surface(self._base_icon_surface(base_icon_name, size), 0, 0)
+        cr.paint()
+
+        # Lay the text out in 24px units so it keeps its proportions at every size
+        cr.scale(size / 24, size / 24)
+        width = height = 24
+
+        # Draw text bottom-right with slight outline for contrast
+        layout = self._text_layout
+        if layout is None:
+            layout = PangoCairo.create_layout(cr)
+            if self._font_desc is None:
+                # Use a compact font
+                self._font_desc = Pango.FontDescription('Sans Bold 10')
+            layout.set_font_description(self._font_desc)
+            self._text_layout = layout
+        else:
+            # Rebind the shared layout to this render's context
+            PangoCairo.update_layout(cr, layout)
+        layout.set_text(text, -1)
+        text_w, text_h = layout.get_pixel_size()
+        # Prefer centered near bottom for visibility
+        x = max(1, (width - text_w) // 2)
+        y = max(1, height - text_h - 1)
+
+        # Draw semi-transparent background for contrast
+        bg_pad_x, bg_pad_y = 2, 1
+        bg_x = max(0, x - bg_pad_x)
+        bg_y = max(0, y - bg_pad_y)
+        bg_w = min(width, text_w + bg_pad_x * 2)
+        bg_h = min(height, text_h + bg_pad_y * 2)
+        cr.save()
+        cr.set_source_rgba(0, 0, 0, 0.35)
+        cr.rectangle(bg_x, bg_y, bg_w, bg_h)
+        cr.fill()
+        cr.restore()
+
+        # Build the glyph path once: stroke it for the outline, fill for the text
+        cr.save()
+        cr.translate(x, y)
+        PangoCairo.layout_path(cr, layout)
+        cr.restore()
+        # Outline (black); a 2px stroke extends 1px outside the glyphs
+        cr.set_line_width(2)
+        cr.set_source_rgba(0, 0, 0, 0.85)
+        cr.stroke_preserve()
+        # Text (white)
+        cr.set_source_rgba(1, 1, 1, 1)
+        cr.fill()
+        return surface
+
+    def _on_icon_theme_changed(self, *_):
+        # Base icons come from the theme: drop cached surfaces and force the
+        # next refresh to set a freshly keyed icon
+        self._base_icon_cache.clear()
+        self._last_icon_key = None
+
+    def _base_icon_surface(self, icon_name: str, size: int):
+        """Return the theme icon as a cairo surface, loading it on first use."""
+        key = (icon_name, size)
+        surface = self._base_icon_cache.get(key)
+        if surface is None:
             # Load base icon pixbuf from the current theme
             theme = Gtk.IconTheme.get_default()
             try:
-                pixbuf = theme.load_icon(base_icon_name, size, 0)
+                pixbuf = theme.load_icon(icon_name, size, 0)
             except Exception:
                 pixbuf = theme.load_icon(DEFAULT_ICON, size, 0)
+            surface = Gdk.cairo_surface_create_from_pixbuf(pixbuf, 1, None)
+            self._base_icon_cache[key] = surface
+        return surface
 
-            # Create cairo surface
-            width, height = size, size
-            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
-            cr = cairo.Context(surface)
-
-            # Paint base icon
-            Gdk.cairo_set_source_pixbuf(cr, pixbuf, 0, 0)
-            cr.paint()
-
-            # Draw text bottom-right with slight outline for contrast
-            layout = PangoCairo.create_layout(cr)
-            # Use a compact font
-            desc = Pango.FontDescription('Sans Bold 10')
-            layout.set_font_description(desc)
-            layout.set_text(text, -1)
-            text_w, text_h = layout.get_pixel_size()
-            # Prefer centered near bottom for visibility
-            x = max(1, (width - text_w) // 2)
-            y = max(1, height - text_h - 1)
-
-            # Draw semi-transparent background for contrast
-            bg_pad_x, bg_pad_y = 2, 1
-            bg_x = max(0, x - bg_pad_x)
-            bg_y = max(0, y - bg_pad_y)
-            bg_w = min(width, text_w + bg_pad_x * 2)
-            bg_h = min(height, text_h + bg_pad_y * 2)
-            cr.save()
-            cr.set_source_rgba(0, 0, 0, 0.35)
-            cr.rectangle(bg_x, bg_y, bg_w, bg_h)
-            cr.fill()
-            cr.restore()
-
-            # Outline (black)
-            cr.set_source_rgba(0, 0, 0, 0.85)
-            for dx, dy in ((-1,0),(1,0),(0,-1),(0,1)):
-                cr.save()
-                cr.translate(x+dx, y+dy)
-                PangoCairo.show_layout(cr, layout)
-                cr.restore()
-            # Text (white)
-            cr.set_source_rgba(1, 1, 1, 1)
-            cr.save()
-            cr.translate(x, y)
-            PangoCairo.show_layout(cr, layout)
-            cr.restore()
-
-            # Save to a hashed filename to avoid cache issues
-            h = hashlib.md5(f"{base_icon_name}|{text}|{size}".encode()).hexdigest()[:10]
-            icon_basename = f"weather_temp_{h}"
-            icon_path = os.path.join(self._icon_theme_status_24, icon_basename + '.png')
-            surface.write_to_png(icon_path)
-            return icon_path
-        except Exception:
-            return base_icon_name  # Fallback to base icon name
+    def _evict_old_icons(self):
+        """Keep only the ICON_CACHE_MAX_FILES most recently used icons."""
+        try:
+            entries = [
+                e for e in os.scandir(self._icon_status_dir)
+                if e.is_file() and e.path != self._last_icon_file
+            ]
+            entries.sort(key=lambda e: e.stat().st_atime, reverse=True)
+        except OSError:
+            return
+        # One slot is taken by the icon currently shown
+        for e in entries[ICON_CACHE_MAX_FILES - 1:]:
+            try:
+                os.unlink(e.path)
+            except OSError:
+                pass
 
     def _set_icon_and_label(self, base_icon_name: str, label: str, temp: float | None = None):
         # Always set the indicator label (may not be shown by GNOME, but harmless)
@@ -232,6 +554,9 @@ class WeatherTray:
                     overlay_text = overlay_text[-3:] + '°'
             except Exception:
                 overlay_text = None
+        icon_key = (base_icon_name, overlay_text or label)
+        if icon_key == self._last_icon_key:
+            return  # Indicator already shows this icon
         icon_ref = self._render_icon_with_text(base_icon_name, overlay_text or label)
         # Try setting via absolute file path first
         try:
@@ -243,19 +568,24 @@ class WeatherTray:
             except Exception:
                 # Fallback to base icon name
                 self.ind.set_icon_full(base_icon_name, 'weather')
+        # Only remember rendered overlays so a failed render is retried next time
+        self._last_icon_key = icon_key if icon_ref != base_icon_name else None
 
     def on_refresh(self, _=None):
         # Trigger a background refresh without blocking the UI
         self.refresh_async()
 
     def on_open_details(self, _=None):
-        # Open or focus a simple details window without a terminal
-        if getattr(self, '_details_win', None) and self._details_win.get_visible():
+        # Open or focus a simple details window without a terminal. The window
+        # is only hidden on close, so build it once and re-present it after.
+        if getattr(self, '_details_win', None) is not None:
             self._details_win.present()
             self.update_details_view()
             return
-        win = Gtk.Window(title=f"Weather — {self.city}")
+        win = Gtk.Window(title=f"Weather — {self.city or '…'}")
         win.set_default_size(420, 520)
+        # Hide instead of destroy when closed from the window manager too
+        win.connect('delete-event', lambda w, *_: w.hide_on_delete())
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         win.add(box)
 
@@ -286,27 +616,42 @@ class WeatherTray:
     def on_quit(self, _=None):
         Gtk.main_quit()
 
+    def _initial_refresh(self):
+        # One-shot idle callback: refresh_async returns True to keep the
+        # periodic timer alive, which would keep an idle source firing forever
+        self.refresh_async()
+        return False
+
     def refresh_async(self, *_):
-        # Start a worker thread to fetch data, then update UI via idle_add
+        # Start a worker thread to fetch data, then update UI via idle_add.
+        # Requests made while one is running are coalesced into it.
+        if self._refresh_in_flight:
+            return True  # keep timer
         def _worker():
             try:
-                data = fetch_weather(self._lat, self._lon)
-                ts0 = data['properties']['timeseries'][0]
-                details = ts0['data']['instant']['details']
-                temp = safe_temp(details.get('air_temperature'))
-                # Match CLI fallback: next_1_hours -> next_6_hours -> next_12_hours
-                sym = (
-                    ts0['data'].get('next_1_hours', {}).get('summary', {}).get('symbol_code')
-                    or ts0['data'].get('next_6_hours', {}).get('summary', {}).get('symbol_code')
-                    or ts0['data'].get('next_12_hours', {}).get('summary', {}).get('symbol_code')
-                    or ''
-                )
-                icon_name = icon_name_from_symbol(sym)
+                if self._lat is None:
+                    city = self.city or detect_city()
+                    self._lat, self._lon = get_coords(city)
+                    self.city = city
+                raw, data = fetch_forecast(self._lat, self._lon)
+                if data is not None:
+                    ts0 = data.properties.timeseries[0]
+                elif ijson is not None:
+                    # The tray only needs the current step; the full forecast
+                    # is decoded on demand by the details window
+                    ts0 = first_timestep(raw)
+                else:
+                    data = decode_forecast(raw)
+                    ts0 = data.properties.timeseries[0]
+                temp = safe_temp(ts0.data.instant.details.air_temperature)
+                icon_name = icon_name_from_symbol(step_symbol_code(ts0))
                 # Match CLI precision closer (keep one decimal)
                 label = f"{temp:.1f}°C" if temp is not None else 'N/A'
                 def _apply():
+                    self._refresh_in_flight = False
                     self._set_icon_and_label(icon_name, label, temp)
                     self._last_update = datetime.now()
+                    self._last_raw = raw
                     self._last_data = data
                     self.item_title.set_label(f"Weather — {self.city} · {label}")
                     # If details window is open, refresh its contents
@@ -316,37 +661,39 @@ class WeatherTray:
                 GLib.idle_add(_apply)
             except Exception:
                 def _err():
-                    self.item_title.set_label(f"Weather — {self.city} · error")
+                    self._refresh_in_flight = False
+                    self.item_title.set_label(f"Weather — {self.city or '…'} · error")
                     return False
                 GLib.idle_add(_err)
+        self._refresh_in_flight = True
         threading.Thread(target=_worker, daemon=True).start()
-        return True  # keep timer
+        return True  # keep timer (timeout_add_seconds only)
 
     def update_details_view(self):
         # Render a readable summary in the details window
         if not getattr(self, '_details_text', None):
             return
+        # The city may only be known after the window was first built
+        self._details_win.set_title(f"Weather — {self.city or '…'}")
         try:
             # Ensure we have fresh-ish data (kick off a background refresh)
-            if not getattr(self, '_last_data', None) or (self._last_update and (datetime.now() - self._last_update).seconds > REFRESH_SECONDS):
+            age = (datetime.now() - self._last_update).total_seconds() if self._last_update else float('inf')
+            if self._last_raw is None or age > REFRESH_SECONDS:
                 self.refresh_async()
-            data = getattr(self, '_last_data', None)
+            if self._last_data is None and self._last_raw is not None:
+                self._last_data = decode_forecast(self._last_raw)
+            data = self._last_data
             if not data:
                 buf = "Weather data unavailable."
             else:
-                ts = data['properties']['timeseries']
+                ts = data.properties.timeseries
                 now = ts[0]
-                det = now['data']['instant']['details']
-                temp = det.get('air_temperature')
-                wind = det.get('wind_speed')
-                hum = det.get('relative_humidity')
-                pres = det.get('air_pressure_at_sea_level')
-                sym = (
-                    now['data'].get('next_1_hours', {}).get('summary', {}).get('symbol_code')
-                    or now['data'].get('next_6_hours', {}).get('summary', {}).get('symbol_code')
-                    or now['data'].get('next_12_hours', {}).get('summary', {}).get('symbol_code')
-                    or ''
-                )
+                det = now.data.instant.details
+                temp = det.air_temperature
+                wind = det.wind_speed
+                hum = det.relative_humidity
+                pres = det.air_pressure_at_sea_level
+                sym = step_symbol_code(now)
                 # Build a simple hourly preview (next 8 hours)
                 lines = []
                 lines.append(f"City: {self.city}")
@@ -357,11 +704,15 @@ class WeatherTray:
                 lines.append("")
                 lines.append("Hourly (next 8h):")
                 for row in ts[:8]:
-                    t = datetime.fromisoformat(row['time'].replace('Z','+00:00')).strftime('%H:%M')
-                    d = row['data']
-                    at = d['instant']['details'].get('air_temperature')
-                    p = d.get('next_1_hours', {}).get('details', {}).get('precipitation_amount', 0)
-                    sc = d.get('next_1_hours', {}).get('summary', {}).get('symbol_code', '')
+                    # MET times are fixed-format UTC: YYYY-MM-DDTHH:MM:SSZ
+                    t = row.time[11:16]
+                    d = row.data
+                    at = d.instant.details.air_temperature
+                    n1 = d.next_1_hours
+                    p = n1.details.precipitation_amount if n1 and n1.details else None
+                    if p is None:
+                        p = 0
+                    sc = (n1.summary.symbol_code if n1 and n1.summary else None) or ''
                     lines.append(f" {t}  {at}°C  precip {p} mm  {sc}")
                 buf = "\n".join(lines)
         except Exception as e: